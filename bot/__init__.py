@@ -1,11 +1,14 @@
 from bot.client import BinanceTestnetClient
-from bot.orders import OrderManager
+from bot.aio_client import AsyncBinanceTestnetClient
+from bot.orders import OrderManager, AsyncOrderManager
 from bot.validators import ValidationError, validate_order_params
 from bot.logging_config import setup_logging
 
 __all__ = [
     'BinanceTestnetClient',
+    'AsyncBinanceTestnetClient',
     'OrderManager',
+    'AsyncOrderManager',
     'ValidationError',
     'validate_order_params',
     'setup_logging'
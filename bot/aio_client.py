@@ -0,0 +1,283 @@
+import asyncio
+import logging
+from decimal import Decimal
+from typing import Dict, Optional
+
+import httpx
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+from bot.client import _BinanceClientBase, _loads
+
+
+logger = logging.getLogger("trading_bot")
+
+
+class AsyncBinanceTestnetClient(_BinanceClientBase):
+    """
+    Asynchronous wrapper for Binance Futures Testnet API interactions.
+    
+    Uses a single shared HTTP/2 client so independent requests
+    (e.g. exchange info and ticker price) are multiplexed concurrently
+    over one connection.
+    """
+    
+    def __init__(self, api_key: str, api_secret: str):
+        """
+        Initialize async Binance Futures Testnet client.
+        
+        Args:
+            api_key: Binance API key
+            api_secret: Binance API secret
+        """
+        super().__init__(api_key, api_secret)
+        
+        # Created lazily so it is bound to the running event loop
+        self._http: Optional[httpx.AsyncClient] = None
+        
+        logger.info("Async Binance Testnet client initialized")
+    
+    async def __aenter__(self) -> "AsyncBinanceTestnetClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP client and release pooled connections.
+        """
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it on first use.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=20,
+                    keepalive_expiry=60
+                ),
+                headers={'X-MBX-APIKEY': self.api_key}
+            )
+        return self._http
+    
+    async def get_symbol_info(self, symbol: str) -> Optional[Dict]:
+        """
+        Get trading rules and symbol information.
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Symbol info dictionary or None if not found
+        """
+        symbol_info = self._cached_symbol_info(symbol)
+        if symbol_info is not None:
+            return symbol_info
+        
+        try:
+            logger.debug("Fetching symbol info for %s", symbol)
+            
+            url = f"{self.TESTNET_BASE_URL}/fapi/v1/exchangeInfo"
+            response = await self._get_http().get(url)
+            
+            if response.status_code == 200:
+                return self._store_exchange_info(response.content, symbol)
+            else:
+                logger.error(f"Failed to get exchange info: {response.status_code}")
+                return None
+        
+        except Exception as e:
+            logger.error(f"Error fetching symbol info: {str(e)}")
+            return None
+    
+    async def get_current_price(self, symbol: str) -> Optional[float]:
+        """
+        Get current market price for a symbol.
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Current price or None if error
+        """
+        try:
+            url = f"{self.TESTNET_BASE_URL}/fapi/v1/ticker/price"
+            params = {'symbol': symbol}
+            
+            response = await self._get_http().get(url, params=params)
+            
+            if response.status_code == 200:
+                return self._parse_price(response.content, symbol)
+            else:
+                logger.error(f"Failed to get price: {response.status_code}")
+                return None
+        
+        except Exception as e:
+            logger.error(f"Error fetching current price: {str(e)}")
+            return None
+    
+    async def get_server_time(self) -> Optional[int]:
+        """
+        Get the exchange server time and record the local clock offset.
+        
+        Returns:
+            Server time in ms or None if error
+        """
+        try:
+            url = f"{self.TESTNET_BASE_URL}/fapi/v1/time"
+            
+            response = await self._get_http().get(url)
+            
+            if response.status_code == 200:
+                return self._store_server_time(response.content)
+            else:
+                logger.error(f"Failed to get server time: {response.status_code}")
+                return None
+        
+        except Exception as e:
+            logger.error(f"Error fetching server time: {str(e)}")
+            return None
+    
+    async def prefetch(self, symbol: str) -> Dict:
+        """
+        Fetch everything needed before placing an order concurrently.
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Dictionary with 'symbol_info', 'price' and 'server_time'
+            (each None if its request failed)
+        """
+        symbol_info, price, server_time = await asyncio.gather(
+            self.get_symbol_info(symbol),
+            self.get_current_price(symbol),
+            self.get_server_time()
+        )
+        return {
+            'symbol_info': symbol_info,
+            'price': price,
+            'server_time': server_time
+        }
+    
+    async def _create_order(self, order_params: Dict) -> Dict:
+        """
+        Sign and submit an order to the futures order endpoint.
+        
+        Args:
+            order_params: Order parameters without timestamp/signature
+        
+        Returns:
+            Order response dictionary
+        
+        Raises:
+            BinanceAPIException: If API returns an error
+            BinanceRequestException: If the response is not valid JSON
+        """
+        params = dict(order_params)
+        params['timestamp'] = self._timestamp()
+        body = self._signed_query(params)
+        
+        # Send the exact bytes that were signed
+        url = f"{self.TESTNET_BASE_URL}/fapi/v1/order"
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        response = await self._get_http().post(url, content=body.encode('utf-8'),
+                                               headers=headers)
+        
+        if not response.is_success:
+            raise BinanceAPIException(response, response.status_code, response.text)
+        try:
+            return _loads(response.content)
+        except ValueError:
+            raise BinanceRequestException(f"Invalid Response: {response.text}")
+    
+    async def place_market_order(self, symbol: str, side: str, quantity: Decimal) -> Dict:
+        """
+        Place a market order on Binance Futures Testnet.
+        
+        Args:
+            symbol: Trading pair symbol
+            side: Order side (BUY or SELL)
+            quantity: Order quantity
+        
+        Returns:
+            Order response dictionary
+        
+        Raises:
+            BinanceAPIException: If API returns an error
+            Exception: For other errors
+        """
+        try:
+            logger.info(f"Placing MARKET order: {side} {quantity} {symbol}")
+            
+            order_params = self._market_order_params(symbol, side, quantity)
+            
+            logger.debug("Order parameters: %s", order_params)
+            
+            response = await self._create_order(order_params)
+            
+            logger.info(f"Market order placed successfully. Order ID: {response.get('orderId')}")
+            logger.debug("Full order response: %s", response)
+            
+            return response
+        
+        except BinanceAPIException as e:
+            logger.error(f"Binance API error: {e.status_code} - {e.message}")
+            raise
+        except BinanceRequestException as e:
+            logger.error(f"Binance request error: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error placing market order: {str(e)}")
+            raise
+    
+    async def place_limit_order(self, symbol: str, side: str, quantity: Decimal,
+                                price: Decimal, time_in_force: str = 'GTC') -> Dict:
+        """
+        Place a limit order on Binance Futures Testnet.
+        
+        Args:
+            symbol: Trading pair symbol
+            side: Order side (BUY or SELL)
+            quantity: Order quantity
+            price: Order price
+            time_in_force: Time in force (GTC, IOC, FOK)
+        
+        Returns:
+            Order response dictionary
+        
+        Raises:
+            BinanceAPIException: If API returns an error
+            Exception: For other errors
+        """
+        try:
+            logger.info(f"Placing LIMIT order: {side} {quantity} {symbol} @ {price}")
+            
+            order_params = self._limit_order_params(symbol, side, quantity,
+                                                    price, time_in_force)
+            
+            logger.debug("Order parameters: %s", order_params)
+            
+            response = await self._create_order(order_params)
+            
+            logger.info(f"Limit order placed successfully. Order ID: {response.get('orderId')}")
+            logger.debug("Full order response: %s", response)
+            
+            return response
+        
+        except BinanceAPIException as e:
+            logger.error(f"Binance API error: {e.status_code} - {e.message}")
+            raise
+        except BinanceRequestException as e:
+            logger.error(f"Binance request error: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error placing limit order: {str(e)}")
+            raise
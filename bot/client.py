@@ -2,27 +2,97 @@ import logging
 import time
 import hmac
 import hashlib
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from typing import Dict, Optional
 from urllib.parse import urlencode
 
-import requests
+import httpx
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speedup, fall back to the standard library
+    import json
+    _loads = json.loads
+
 
 logger = logging.getLogger("trading_bot")
 
+# HMAC signing relies on the OpenSSL-backed SHA-256 from hashlib
+if hashlib.sha256().name != 'sha256':
+    raise ImportError("hashlib does not provide a usable SHA-256 implementation")
+
+# Signed-request keys whose values are plain ASCII tokens and never need escaping
+_FAST_KEYS = ('symbol', 'side', 'type', 'quantity', 'price',
+              'timeInForce', 'timestamp', 'recvWindow')
+_FAST_KEY_SET = frozenset(_FAST_KEYS)
+
 
-class BinanceTestnetClient:
+def _now_ms() -> int:
     """
-    Wrapper for Binance Futures Testnet API interactions.
+    Current Unix time in milliseconds, computed without float rounding.
+    """
+    return time.time_ns() // 1_000_000
+
+
+def _format_decimal(value: Decimal) -> str:
+    """
+    Render a quantity or price in plain positional notation (never
+    ``1E+2``/``1E-7``).
+    
+    Args:
+        value: Decimal quantity or price; other numbers and strings are
+            converted through ``str`` first
+        
+    Returns:
+        String form accepted by the Binance API
+    """
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return format(value, 'f')
+
+
+def _fast_qs(params: Dict) -> str:
+    """
+    Build the query string for a signed request.
+    
+    Parameters limited to the known order schema are joined directly in a
+    fixed key order; anything else falls back to ``urlencode``. The result
+    must be sent verbatim so the signed and transmitted bytes match.
+    
+    Args:
+        params: Request parameters
+        
+    Returns:
+        URL query string
+    """
+    if not _FAST_KEY_SET.issuperset(params):
+        return urlencode(params)
+    
+    assert not any('&' in str(v) or '=' in str(v) for v in params.values()), \
+        "Signed parameter values must not contain '&' or '='"
+    
+    return '&'.join(f'{k}={params[k]}' for k in _FAST_KEYS if k in params)
+
+
+class _BinanceClientBase:
+    """
+    Transport-independent state and helpers shared by the sync and async clients.
+    
+    Holds credentials, the precomputed HMAC key, the exchangeInfo cache and
+    the server clock offset; subclasses only perform the HTTP calls.
     """
     
     TESTNET_BASE_URL = "https://testnet.binancefuture.com"
+    SYMBOL_CACHE_TTL = 300  # seconds
     
     def __init__(self, api_key: str, api_secret: str):
         """
-        Initialize Binance Futures Testnet client.
+        Initialize shared client state.
         
         Args:
             api_key: Binance API key
@@ -31,29 +101,235 @@ class BinanceTestnetClient:
         self.api_key = api_key
         self.api_secret = api_secret
         
-        # Initialize python-binance client with testnet URL
-        self.client = Client(api_key, api_secret, testnet=True)
-        self.client.API_URL = self.TESTNET_BASE_URL
+        # Keyed HMAC state computed once and copied per signature
+        self._secret_bytes = api_secret.encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, b'', hashlib.sha256)
         
-        logger.info("Binance Testnet client initialized")
+        # exchangeInfo symbols keyed by name, refreshed every SYMBOL_CACHE_TTL
+        self._symbol_cache: Dict[str, Dict] = {}
+        self._symbol_cache_ts: float = 0.0
         
-    def _generate_signature(self, params: Dict) -> str:
+        # Server minus local clock in ms, refreshed by prefetch()
+        self._time_offset = 0
+    
+    def _generate_signature(self, query_string: str) -> str:
         """
         Generate HMAC SHA256 signature for API request.
         
         Args:
-            params: Request parameters
+            query_string: Exact query string that will be sent
             
         Returns:
             Signature string
         """
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        # Copying the keyed template skips re-deriving the inner/outer pads
+        h = self._hmac_template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
+    
+    def _signed_query(self, params: Dict) -> str:
+        """
+        Build a signed query string for a private endpoint.
+        
+        Args:
+            params: Request parameters
+            
+        Returns:
+            Query string with the signature appended
+        """
+        query_string = _fast_qs(params)
+        return f"{query_string}&signature={self._generate_signature(query_string)}"
+    
+    def _timestamp(self) -> int:
+        """
+        Current request timestamp in ms, corrected by the known server offset.
+        """
+        return _now_ms() + self._time_offset
+    
+    def _cached_symbol_info(self, symbol: str) -> Optional[Dict]:
+        """
+        Return symbol info from the cache if it is still fresh.
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            Cached symbol info, or None if a fetch is needed
+        """
+        if (time.time() - self._symbol_cache_ts < self.SYMBOL_CACHE_TTL
+                and symbol in self._symbol_cache):
+            logger.debug("Symbol info for %s served from cache", symbol)
+            return self._symbol_cache[symbol]
+        return None
+    
+    def _store_exchange_info(self, content: bytes, symbol: str) -> Optional[Dict]:
+        """
+        Parse an exchangeInfo payload into the symbol cache.
+        
+        Args:
+            content: Raw exchangeInfo response body
+            symbol: Trading pair symbol to look up
+            
+        Returns:
+            Symbol info dictionary or None if not found
+        """
+        data = _loads(content)
+        self._symbol_cache = {s['symbol']: s for s in data.get('symbols', ())}
+        self._symbol_cache_ts = time.time()
+        
+        symbol_info = self._symbol_cache.get(symbol)
+        if symbol_info is not None:
+            logger.debug("Symbol info retrieved: %s", symbol_info)
+            return symbol_info
+        
+        logger.warning(f"Symbol {symbol} not found in exchange info")
+        return None
+    
+    def _parse_price(self, content: bytes, symbol: str) -> float:
+        """
+        Parse a ticker/price payload.
+        
+        Args:
+            content: Raw ticker/price response body
+            symbol: Trading pair symbol
+            
+        Returns:
+            Current price
+        """
+        price = float(_loads(content)['price'])
+        logger.debug("Current price for %s: %s", symbol, price)
+        return price
+    
+    def _store_server_time(self, content: bytes) -> int:
+        """
+        Parse a server time payload and record the local clock offset.
+        
+        Args:
+            content: Raw /fapi/v1/time response body
+            
+        Returns:
+            Server time in ms
+        """
+        server_time = int(_loads(content)['serverTime'])
+        self._time_offset = server_time - _now_ms()
+        logger.debug("Server time %s (offset %s ms)", server_time, self._time_offset)
+        return server_time
+    
+    @staticmethod
+    def _market_order_params(symbol: str, side: str, quantity: Decimal) -> Dict:
+        """
+        Build MARKET order parameters (without timestamp/signature).
+        """
+        return {
+            'symbol': symbol,
+            'side': side,
+            'type': 'MARKET',
+            'quantity': _format_decimal(quantity)
+        }
+    
+    @staticmethod
+    def _limit_order_params(symbol: str, side: str, quantity: Decimal,
+                            price: Decimal, time_in_force: str) -> Dict:
+        """
+        Build LIMIT order parameters (without timestamp/signature).
+        """
+        return {
+            'symbol': symbol,
+            'side': side,
+            'type': 'LIMIT',
+            'quantity': _format_decimal(quantity),
+            'price': _format_decimal(price),
+            'timeInForce': time_in_force
+        }
+
+
+class BinanceTestnetClient(_BinanceClientBase):
+    """
+    Wrapper for Binance Futures Testnet API interactions.
+    """
+    
+    def __init__(self, api_key: str, api_secret: str):
+        """
+        Initialize Binance Futures Testnet client.
+        
+        Args:
+            api_key: Binance API key
+            api_secret: Binance API secret
+        """
+        super().__init__(api_key, api_secret)
+        
+        # Keep-alive HTTP/2 client: one TLS connection multiplexes concurrent
+        # requests, and connection failures are retried by the transport
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+        )
+        self._http = httpx.Client(
+            transport=transport,
+            timeout=10.0,
+            headers={'X-MBX-APIKEY': self.api_key}
+        )
+        
+        # python-binance client pings the API on construction, so it is
+        # created lazily on first use (see the ``client`` property)
+        self._bclient: Optional[Client] = None
+        
+        logger.info("Binance Testnet client initialized")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HMAC-SHA256 signing via %s; guaranteed algorithms: %s",
+                         ssl.OPENSSL_VERSION, sorted(hashlib.algorithms_guaranteed))
+    
+    @property
+    def client(self) -> Client:
+        """
+        python-binance client configured for the testnet.
+        
+        Created on first access; only order placement needs it, so
+        read-only calls such as ``get_current_price`` avoid its startup
+        round-trip.
+        """
+        if self._bclient is None:
+            self._bclient = Client(self.api_key, self.api_secret, testnet=True)
+            self._bclient.API_URL = self.TESTNET_BASE_URL
+            self._bclient.timestamp_offset = self._time_offset
+        return self._bclient
+    
+    def __enter__(self) -> "BinanceTestnetClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client and release pooled connections.
+        """
+        self._http.close()
+        if self._bclient is not None:
+            self._bclient.close_connection()
+    
+    def ping(self) -> bool:
+        """
+        Check that the API is reachable using the unsigned ping endpoint.
+        
+        Returns:
+            True if the API responded, False otherwise
+        """
+        try:
+            url = f"{self.TESTNET_BASE_URL}/fapi/v1/ping"
+            response = self._http.get(url)
+            
+            if response.status_code == 200:
+                logger.debug("API ping successful")
+                return True
+            else:
+                logger.error(f"API ping failed: {response.status_code}")
+                return False
+                
+        except Exception as e:
+            logger.error(f"API ping failed: {str(e)}")
+            return False
     
     def test_connection(self) -> bool:
         """
@@ -67,13 +343,10 @@ class BinanceTestnetClient:
             # Test connection by fetching account info
             url = f"{self.TESTNET_BASE_URL}/fapi/v2/account"
             
-            timestamp = int(time.time() * 1000)
-            params = {'timestamp': timestamp}
-            params['signature'] = self._generate_signature(params)
+            timestamp = self._timestamp()
+            query_string = self._signed_query({'timestamp': timestamp})
             
-            headers = {'X-MBX-APIKEY': self.api_key}
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._http.get(f"{url}?{query_string}")
             
             if response.status_code == 200:
                 logger.info("API connection successful")
@@ -96,21 +369,18 @@ class BinanceTestnetClient:
         Returns:
             Symbol info dictionary or None if not found
         """
+        symbol_info = self._cached_symbol_info(symbol)
+        if symbol_info is not None:
+            return symbol_info
+        
         try:
-            logger.debug(f"Fetching symbol info for {symbol}")
+            logger.debug("Fetching symbol info for %s", symbol)
             
             url = f"{self.TESTNET_BASE_URL}/fapi/v1/exchangeInfo"
-            response = requests.get(url, timeout=10)
+            response = self._http.get(url)
             
             if response.status_code == 200:
-                data = response.json()
-                for s in data.get('symbols', []):
-                    if s['symbol'] == symbol:
-                        logger.debug(f"Symbol info retrieved: {s}")
-                        return s
-                
-                logger.warning(f"Symbol {symbol} not found in exchange info")
-                return None
+                return self._store_exchange_info(response.content, symbol)
             else:
                 logger.error(f"Failed to get exchange info: {response.status_code}")
                 return None
@@ -119,7 +389,7 @@ class BinanceTestnetClient:
             logger.error(f"Error fetching symbol info: {str(e)}")
             return None
     
-    def place_market_order(self, symbol: str, side: str, quantity: float) -> Dict:
+    def place_market_order(self, symbol: str, side: str, quantity: Decimal) -> Dict:
         """
         Place a market order on Binance Futures Testnet.
         
@@ -134,25 +404,23 @@ class BinanceTestnetClient:
         Raises:
             BinanceAPIException: If API returns an error
             Exception: For other errors
+            
+        Note:
+            The first order initializes the python-binance client.
         """
         try:
             logger.info(f"Placing MARKET order: {side} {quantity} {symbol}")
             
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': 'MARKET',
-                'quantity': quantity,
-                'timestamp': int(time.time() * 1000)
-            }
+            order_params = self._market_order_params(symbol, side, quantity)
+            order_params['timestamp'] = self._timestamp()
             
-            logger.debug(f"Order parameters: {order_params}")
+            logger.debug("Order parameters: %s", order_params)
             
             # Use python-binance library
             response = self.client.futures_create_order(**order_params)
             
             logger.info(f"Market order placed successfully. Order ID: {response.get('orderId')}")
-            logger.debug(f"Full order response: {response}")
+            logger.debug("Full order response: %s", response)
             
             return response
             
@@ -166,8 +434,8 @@ class BinanceTestnetClient:
             logger.error(f"Unexpected error placing market order: {str(e)}")
             raise
     
-    def place_limit_order(self, symbol: str, side: str, quantity: float, 
-                         price: float, time_in_force: str = 'GTC') -> Dict:
+    def place_limit_order(self, symbol: str, side: str, quantity: Decimal, 
+                         price: Decimal, time_in_force: str = 'GTC') -> Dict:
         """
         Place a limit order on Binance Futures Testnet.
         
@@ -184,27 +452,24 @@ class BinanceTestnetClient:
         Raises:
             BinanceAPIException: If API returns an error
             Exception: For other errors
+            
+        Note:
+            The first order initializes the python-binance client.
         """
         try:
             logger.info(f"Placing LIMIT order: {side} {quantity} {symbol} @ {price}")
             
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': 'LIMIT',
-                'quantity': quantity,
-                'price': price,
-                'timeInForce': time_in_force,
-                'timestamp': int(time.time() * 1000)
-            }
+            order_params = self._limit_order_params(symbol, side, quantity,
+                                                    price, time_in_force)
+            order_params['timestamp'] = self._timestamp()
             
-            logger.debug(f"Order parameters: {order_params}")
+            logger.debug("Order parameters: %s", order_params)
             
             # Use python-binance library
             response = self.client.futures_create_order(**order_params)
             
             logger.info(f"Limit order placed successfully. Order ID: {response.get('orderId')}")
-            logger.debug(f"Full order response: {response}")
+            logger.debug("Full order response: %s", response)
             
             return response
             
@@ -232,13 +497,10 @@ class BinanceTestnetClient:
             url = f"{self.TESTNET_BASE_URL}/fapi/v1/ticker/price"
             params = {'symbol': symbol}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self._http.get(url, params=params)
             
             if response.status_code == 200:
-                data = response.json()
-                price = float(data['price'])
-                logger.debug(f"Current price for {symbol}: {price}")
-                return price
+                return self._parse_price(response.content, symbol)
             else:
                 logger.error(f"Failed to get price: {response.status_code}")
                 return None
@@ -246,3 +508,52 @@ class BinanceTestnetClient:
         except Exception as e:
             logger.error(f"Error fetching current price: {str(e)}")
             return None
+    
+    def get_server_time(self) -> Optional[int]:
+        """
+        Get the exchange server time and record the local clock offset.
+        
+        Returns:
+            Server time in ms or None if error
+        """
+        try:
+            url = f"{self.TESTNET_BASE_URL}/fapi/v1/time"
+            response = self._http.get(url)
+            
+            if response.status_code == 200:
+                server_time = self._store_server_time(response.content)
+                if self._bclient is not None:
+                    self._bclient.timestamp_offset = self._time_offset
+                return server_time
+            else:
+                logger.error(f"Failed to get server time: {response.status_code}")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error fetching server time: {str(e)}")
+            return None
+    
+    def prefetch(self, symbol: str) -> Dict:
+        """
+        Fetch everything needed before placing an order in parallel.
+        
+        Symbol info, ticker price and server time are independent, so they
+        are requested concurrently over the shared HTTP/2 connection.
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            Dictionary with 'symbol_info', 'price' and 'server_time'
+            (each None if its request failed)
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            symbol_info = executor.submit(self.get_symbol_info, symbol)
+            price = executor.submit(self.get_current_price, symbol)
+            server_time = executor.submit(self.get_server_time)
+            
+            return {
+                'symbol_info': symbol_info.result(),
+                'price': price.result(),
+                'server_time': server_time.result()
+            }
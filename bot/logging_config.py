@@ -1,5 +1,8 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
@@ -15,7 +18,7 @@ def setup_logging(log_dir: str = "logs") -> logging.Logger:
         Configured logger instance
     """
     # Create logs directory if it doesn't exist
-    Path(log_dir).mkdir(exist_ok=True)
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
     
     # Create logger
     logger = logging.getLogger("trading_bot")
@@ -46,8 +49,17 @@ def setup_logging(log_dir: str = "logs") -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand records to a background thread so callers never block on disk I/O
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    # Keep a reference so the listener is not garbage collected
+    logger._qlistener = listener
     
     logger.info(f"Logging initialized. Log file: {log_filename}")
     
@@ -1,27 +1,340 @@
 import logging
-from typing import Dict, Optional
+import sys
+from decimal import Decimal, DecimalException, ROUND_DOWN, ROUND_HALF_UP
+from typing import Dict, Optional, Union
 
+from bot.aio_client import AsyncBinanceTestnetClient
 from bot.client import BinanceTestnetClient
-from bot.validators import validate_order_params, ValidationError
+from bot.validators import (
+    validate_order_params, validate_order_type, validate_price, validate_quantity,
+    validate_side, validate_symbol, ValidationError
+)
 
 
 logger = logging.getLogger("trading_bot")
 
 
-class OrderManager:
+def _filter_value(symbol_info: Dict, filter_type: str, key: str) -> Optional[Decimal]:
     """
-    Manages order placement and execution.
+    Read a positive Decimal value from one of the symbol's exchange filters.
+    
+    Args:
+        symbol_info: Symbol info from exchangeInfo
+        filter_type: Filter name (e.g. LOT_SIZE, PRICE_FILTER)
+        key: Field within the filter (e.g. stepSize, tickSize)
+        
+    Returns:
+        Filter value, or None if absent or zero (no constraint)
+    """
+    for f in symbol_info.get('filters', []):
+        if f.get('filterType') == filter_type and key in f:
+            value = Decimal(f[key])
+            return value if value > 0 else None
+    return None
+
+
+def _round_to_step(value: Decimal, step: Optional[Decimal], rounding: str) -> Decimal:
+    """
+    Round a value to a multiple of the exchange step/tick size.
+    
+    When a step is given the result is quantized to the step's exponent,
+    so it carries exactly the precision Binance expects.
+    
+    Raises:
+        DecimalException: If the result exceeds the context precision
     """
+    if step is None:
+        return value
+    return ((value / step).to_integral_value(rounding=rounding) * step).quantize(step)
+
+
+def _round_quantity(symbol: str, quantity: Decimal, step_size: Optional[Decimal]) -> Decimal:
+    """
+    Round a quantity down to the symbol's step size.
     
-    def __init__(self, client: BinanceTestnetClient):
+    Raises:
+        ValidationError: If the quantity is out of range or rounds down to zero
+    """
+    try:
+        rounded = _round_to_step(quantity, step_size, ROUND_DOWN)
+    except DecimalException:
+        raise ValidationError(f"Quantity {quantity} is out of range for {symbol}")
+    if rounded <= 0:
+        raise ValidationError(f"Quantity {quantity} is below the minimum "
+                              f"step size {step_size} for {symbol}")
+    return rounded
+
+
+def _round_price(symbol: str, price: Decimal, tick_size: Optional[Decimal]) -> Decimal:
+    """
+    Round a price to the nearest tick.
+    
+    Raises:
+        ValidationError: If the price is out of range or rounds down to zero
+    """
+    try:
+        rounded = _round_to_step(price, tick_size, ROUND_HALF_UP)
+    except DecimalException:
+        raise ValidationError(f"Price {price} is out of range for {symbol}")
+    if rounded <= 0:
+        raise ValidationError(f"Price {price} is below the minimum "
+                              f"tick size {tick_size} for {symbol}")
+    return rounded
+
+
+class _Placer:
+    """
+    Submits repeated orders for a fixed symbol, side and type.
+    
+    Created by OrderManager.prepare(), which validates the symbol, side and
+    type and looks up the exchange filters once. submit() only checks and
+    rounds the quantity and price, then sends the order without banners.
+    """
+    
+    __slots__ = ('_client', 'symbol', 'side', 'order_type', '_step_size', '_tick_size')
+    
+    def __init__(self, client: BinanceTestnetClient, symbol: str, side: str,
+                 order_type: str, step_size: Optional[Decimal],
+                 tick_size: Optional[Decimal]):
+        self._client = client
+        self.symbol = symbol
+        self.side = side
+        self.order_type = order_type
+        self._step_size = step_size
+        self._tick_size = tick_size
+    
+    def submit(self, quantity: Union[Decimal, str],
+               price: Optional[Union[Decimal, str]] = None) -> Dict:
         """
-        Initialize OrderManager.
+        Submit an order with the prepared symbol, side and type.
         
         Args:
-            client: BinanceTestnetClient instance
+            quantity: Order quantity
+            price: Order price (required for LIMIT, rejected for MARKET)
+            
+        Returns:
+            Order response dictionary
+            
+        Raises:
+            ValidationError: If quantity or price is malformed, out of range
+                or not allowed for this order type
+            BinanceAPIException: If API returns an error
+        """
+        quantity = _round_quantity(self.symbol, validate_quantity(quantity), self._step_size)
+        
+        if self.order_type == 'LIMIT':
+            price = validate_price(price)
+            if price is None:
+                raise ValidationError("Price is required for LIMIT orders")
+            order_params = self._client._limit_order_params(
+                self.symbol, self.side, quantity,
+                _round_price(self.symbol, price, self._tick_size), 'GTC'
+            )
+        else:
+            if price is not None and price != "":
+                raise ValidationError("Price should not be specified for MARKET orders")
+            order_params = self._client._market_order_params(self.symbol, self.side, quantity)
+        order_params['timestamp'] = self._client._timestamp()
+        
+        logger.debug("Submitting prepared order: %s", order_params)
+        return self._client.client.futures_create_order(**order_params)
+
+
+class _BaseOrderManager:
+    """
+    Validation, exchange-filter and logging helpers shared by the sync and
+    async order managers.
+    """
+    
+    def __init__(self, client: Union[BinanceTestnetClient, AsyncBinanceTestnetClient]):
+        """
+        Initialize the order manager.
+        
+        Args:
+            client: Sync or async Binance Testnet client
         """
         self.client = client
-        logger.info("OrderManager initialized")
+        logger.info(f"{type(self).__name__} initialized")
+    
+    def _validate(self, symbol: str, side: str, order_type: str,
+                  quantity: str, price: Optional[str]) -> Dict:
+        """
+        Validate raw order inputs.
+        
+        Returns:
+            Dictionary of validated parameters
+        """
+        logger.info(f"Validating order parameters...")
+        params = validate_order_params(symbol, side, order_type, quantity, price)
+        
+        logger.info(f"Order validated: {params['type']} {params['side']} "
+                   f"{params['quantity']} {params['symbol']}")
+        return params
+    
+    def _check_symbol(self, params: Dict, symbol_info: Optional[Dict]) -> None:
+        """
+        Ensure the symbol exists and is currently trading.
+        
+        Raises:
+            ValidationError: If the symbol is unknown or not tradable
+        """
+        if not symbol_info:
+            raise ValidationError(f"Symbol {params['symbol']} not found or not tradable")
+        
+        if symbol_info.get('status') != 'TRADING':
+            raise ValidationError(f"Symbol {params['symbol']} is not currently trading")
+    
+    def _check_limit_price(self, params: Dict, market_price: Optional[float]) -> None:
+        """
+        Warn when a LIMIT order would cross the current market price.
+        
+        Args:
+            params: Validated order parameters
+            market_price: Latest ticker price, or None if unavailable
+        """
+        if market_price is None:
+            logger.warning(f"Could not fetch market price for {params['symbol']}; "
+                           f"skipping LIMIT price check")
+            return
+        
+        logger.info(f"Current market price for {params['symbol']}: {market_price}")
+        
+        crosses = (
+            (params['side'] == 'BUY' and params['price'] > market_price) or
+            (params['side'] == 'SELL' and params['price'] < market_price)
+        )
+        if crosses:
+            logger.warning(f"LIMIT {params['side']} price {params['price']} crosses the "
+                           f"market price {market_price}; order will fill immediately")
+    
+    def _apply_filters(self, params: Dict, symbol_info: Dict) -> None:
+        """
+        Round quantity and price to the symbol's step and tick sizes.
+        
+        Quantity is rounded down so the order never exceeds the requested
+        size; price is rounded to the nearest tick.
+        
+        Args:
+            params: Validated order parameters, updated in place
+            symbol_info: Symbol info from exchangeInfo
+            
+        Raises:
+            ValidationError: If quantity or price is out of range or
+                rounds down to zero
+        """
+        step_size = _filter_value(symbol_info, 'LOT_SIZE', 'stepSize')
+        quantity = _round_quantity(params['symbol'], params['quantity'], step_size)
+        if quantity != params['quantity']:
+            logger.info(f"Quantity adjusted to step size {step_size}: "
+                        f"{params['quantity']} -> {quantity}")
+        params['quantity'] = quantity
+        
+        if params.get('price') is not None:
+            tick_size = _filter_value(symbol_info, 'PRICE_FILTER', 'tickSize')
+            price = _round_price(params['symbol'], params['price'], tick_size)
+            if price != params['price']:
+                logger.info(f"Price adjusted to tick size {tick_size}: "
+                            f"{params['price']} -> {price}")
+            params['price'] = price
+    
+    def _log_order_request(self, params: Dict) -> None:
+        """
+        Log the order request banner.
+        
+        Args:
+            params: Validated order parameters
+        """
+        rule = "=" * 60
+        lines = [
+            rule,
+            f"{params['type']} ORDER REQUEST",
+            rule,
+            f"Symbol:   {params['symbol']}",
+            f"Side:     {params['side']}",
+            f"Quantity: {params['quantity']}"
+        ]
+        if params['type'] == 'LIMIT':
+            lines.append(f"Price:    {params['price']}")
+        lines.append(rule)
+        
+        logger.info("\n".join(lines))
+    
+    def _log_order_response(self, response: Dict) -> None:
+        """
+        Log order response details.
+        
+        Args:
+            response: Order response from API
+        """
+        fields = [
+            ("Order ID:       ", response.get('orderId', 'N/A')),
+            ("Client Order ID: ", response.get('clientOrderId', 'N/A')),
+            ("Symbol:         ", response.get('symbol', 'N/A')),
+            ("Status:         ", response.get('status', 'N/A')),
+            ("Type:           ", response.get('type', 'N/A')),
+            ("Side:           ", response.get('side', 'N/A')),
+            ("Price:          ", response.get('price', 'N/A')),
+            ("Original Qty:   ", response.get('origQty', 'N/A')),
+            ("Executed Qty:   ", response.get('executedQty', 'N/A')),
+        ]
+        
+        # Average price might not be available immediately
+        if 'avgPrice' in response and response['avgPrice'] not in ['0', 0, '', None]:
+            fields.append(("Average Price:  ", response['avgPrice']))
+        
+        fields.append(("Time in Force:  ", response.get('timeInForce', 'N/A')))
+        fields.append(("Update Time:    ", response.get('updateTime', 'N/A')))
+        
+        # Emit the banner as one record: one lock acquisition, one handler pass
+        rule = "=" * 60
+        logger.info("\n".join((
+            rule,
+            "ORDER RESPONSE",
+            rule,
+            *(f"{label}{value}" for label, value in fields),
+            rule
+        )))
+    
+    def print_order_summary(self, response: Dict) -> None:
+        """
+        Print a user-friendly order summary to console.
+        
+        Args:
+            response: Order response from API
+        """
+        rule = "=" * 70
+        lines = [
+            "",
+            rule,
+            "ORDER PLACED SUCCESSFULLY",
+            rule,
+            f"Order ID:        {response.get('orderId')}",
+            f"Symbol:          {response.get('symbol')}",
+            f"Side:            {response.get('side')}",
+            f"Type:            {response.get('type')}",
+            f"Status:          {response.get('status')}",
+            f"Quantity:        {response.get('origQty')}"
+        ]
+        
+        if response.get('type') == 'LIMIT':
+            lines.append(f"Price:           {response.get('price')}")
+        
+        lines.append(f"Executed Qty:    {response.get('executedQty', '0')}")
+        
+        # Show average price if available
+        if 'avgPrice' in response and response['avgPrice'] not in ['0', 0, '', None]:
+            lines.append(f"Average Price:   {response['avgPrice']}")
+        
+        lines.extend((rule, "", ""))
+        
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(lines))
+
+
+class OrderManager(_BaseOrderManager):
+    """
+    Manages order placement and execution.
+    """
     
     def place_order(self, symbol: str, side: str, order_type: str, 
                    quantity: str, price: Optional[str] = None) -> Dict:
@@ -42,27 +355,57 @@ class OrderManager:
             ValidationError: If validation fails
             Exception: If order placement fails
         """
-        # Validate all parameters
-        logger.info(f"Validating order parameters...")
-        params = validate_order_params(symbol, side, order_type, quantity, price)
+        params = self._validate(symbol, side, order_type, quantity, price)
         
-        logger.info(f"Order validated: {params['type']} {params['side']} "
-                   f"{params['quantity']} {params['symbol']}")
+        # Symbol info, reference price and server time in one parallel round-trip
+        prefetched = self.client.prefetch(params['symbol'])
         
         # Check if symbol exists and is tradable
-        symbol_info = self.client.get_symbol_info(params['symbol'])
-        if not symbol_info:
-            raise ValidationError(f"Symbol {params['symbol']} not found or not tradable")
-        
-        if symbol_info.get('status') != 'TRADING':
-            raise ValidationError(f"Symbol {params['symbol']} is not currently trading")
+        self._check_symbol(params, prefetched['symbol_info'])
+        self._apply_filters(params, prefetched['symbol_info'])
         
         # Place the order based on type
         if params['type'] == 'MARKET':
             return self._place_market_order(params)
         else:  # LIMIT
+            self._check_limit_price(params, prefetched['price'])
             return self._place_limit_order(params)
     
+    def prepare(self, symbol: str, side: str, order_type: str) -> _Placer:
+        """
+        Validate a symbol/side/type combination once for repeated orders.
+        
+        Args:
+            symbol: Trading pair symbol
+            side: Order side (BUY/SELL)
+            order_type: Order type (MARKET/LIMIT)
+            
+        Returns:
+            Placer whose submit(quantity, price=None) sends orders directly
+            
+        Raises:
+            ValidationError: If validation fails
+        """
+        params = {
+            'symbol': validate_symbol(symbol),
+            'side': validate_side(side),
+            'type': validate_order_type(order_type)
+        }
+        
+        symbol_info = self.client.get_symbol_info(params['symbol'])
+        self._check_symbol(params, symbol_info)
+        
+        logger.info(f"Prepared {params['type']} {params['side']} orders for {params['symbol']}")
+        
+        return _Placer(
+            self.client,
+            params['symbol'],
+            params['side'],
+            params['type'],
+            _filter_value(symbol_info, 'LOT_SIZE', 'stepSize'),
+            _filter_value(symbol_info, 'PRICE_FILTER', 'tickSize')
+        )
+    
     def _place_market_order(self, params: Dict) -> Dict:
         """
         Place a market order.
@@ -73,13 +416,7 @@ class OrderManager:
         Returns:
             Order response
         """
-        logger.info("=" * 60)
-        logger.info("MARKET ORDER REQUEST")
-        logger.info("=" * 60)
-        logger.info(f"Symbol:   {params['symbol']}")
-        logger.info(f"Side:     {params['side']}")
-        logger.info(f"Quantity: {params['quantity']}")
-        logger.info("=" * 60)
+        self._log_order_request(params)
         
         response = self.client.place_market_order(
             symbol=params['symbol'],
@@ -101,14 +438,7 @@ class OrderManager:
         Returns:
             Order response
         """
-        logger.info("=" * 60)
-        logger.info("LIMIT ORDER REQUEST")
-        logger.info("=" * 60)
-        logger.info(f"Symbol:   {params['symbol']}")
-        logger.info(f"Side:     {params['side']}")
-        logger.info(f"Quantity: {params['quantity']}")
-        logger.info(f"Price:    {params['price']}")
-        logger.info("=" * 60)
+        self._log_order_request(params)
         
         response = self.client.place_limit_order(
             symbol=params['symbol'],
@@ -120,60 +450,89 @@ class OrderManager:
         self._log_order_response(response)
         
         return response
+
+
+class AsyncOrderManager(_BaseOrderManager):
+    """
+    Manages order placement through the asynchronous client.
     
-    def _log_order_response(self, response: Dict) -> None:
+    Pre-order lookups are fetched concurrently through the async client.
+    """
+    
+    async def place_order(self, symbol: str, side: str, order_type: str,
+                          quantity: str, price: Optional[str] = None) -> Dict:
         """
-        Log order response details.
+        Validate inputs and place an order.
         
         Args:
-            response: Order response from API
+            symbol: Trading pair symbol
+            side: Order side (BUY/SELL)
+            order_type: Order type (MARKET/LIMIT)
+            quantity: Order quantity
+            price: Order price (required for LIMIT)
+            
+        Returns:
+            Order response dictionary
+            
+        Raises:
+            ValidationError: If validation fails
+            Exception: If order placement fails
         """
-        logger.info("=" * 60)
-        logger.info("ORDER RESPONSE")
-        logger.info("=" * 60)
-        logger.info(f"Order ID:       {response.get('orderId', 'N/A')}")
-        logger.info(f"Client Order ID: {response.get('clientOrderId', 'N/A')}")
-        logger.info(f"Symbol:         {response.get('symbol', 'N/A')}")
-        logger.info(f"Status:         {response.get('status', 'N/A')}")
-        logger.info(f"Type:           {response.get('type', 'N/A')}")
-        logger.info(f"Side:           {response.get('side', 'N/A')}")
-        logger.info(f"Price:          {response.get('price', 'N/A')}")
-        logger.info(f"Original Qty:   {response.get('origQty', 'N/A')}")
-        logger.info(f"Executed Qty:   {response.get('executedQty', 'N/A')}")
+        params = self._validate(symbol, side, order_type, quantity, price)
         
-        # Average price might not be available immediately
-        if 'avgPrice' in response and response['avgPrice'] not in ['0', 0, '', None]:
-            logger.info(f"Average Price:  {response['avgPrice']}")
+        # Symbol info, reference price and server time in one parallel round-trip
+        prefetched = await self.client.prefetch(params['symbol'])
         
-        logger.info(f"Time in Force:  {response.get('timeInForce', 'N/A')}")
-        logger.info(f"Update Time:    {response.get('updateTime', 'N/A')}")
-        logger.info("=" * 60)
+        self._check_symbol(params, prefetched['symbol_info'])
+        self._apply_filters(params, prefetched['symbol_info'])
+        
+        if params['type'] == 'MARKET':
+            return await self._place_market_order(params)
+        else:  # LIMIT
+            self._check_limit_price(params, prefetched['price'])
+            return await self._place_limit_order(params)
     
-    def print_order_summary(self, response: Dict) -> None:
+    async def _place_market_order(self, params: Dict) -> Dict:
         """
-        Print a user-friendly order summary to console.
+        Place a market order.
         
         Args:
-            response: Order response from API
+            params: Validated order parameters
+            
+        Returns:
+            Order response
         """
-        print("\n" + "=" * 70)
-        print("ORDER PLACED SUCCESSFULLY")
-        print("=" * 70)
-        print(f"Order ID:        {response.get('orderId')}")
-        print(f"Symbol:          {response.get('symbol')}")
-        print(f"Side:            {response.get('side')}")
-        print(f"Type:            {response.get('type')}")
-        print(f"Status:          {response.get('status')}")
-        print(f"Quantity:        {response.get('origQty')}")
+        self._log_order_request(params)
         
-        if response.get('type') == 'LIMIT':
-            print(f"Price:           {response.get('price')}")
+        response = await self.client.place_market_order(
+            symbol=params['symbol'],
+            side=params['side'],
+            quantity=params['quantity']
+        )
         
-        print(f"Executed Qty:    {response.get('executedQty', '0')}")
+        self._log_order_response(response)
         
-        # Show average price if available
-        if 'avgPrice' in response and response['avgPrice'] not in ['0', 0, '', None]:
-            print(f"Average Price:   {response['avgPrice']}")
+        return response
+    
+    async def _place_limit_order(self, params: Dict) -> Dict:
+        """
+        Place a limit order.
+        
+        Args:
+            params: Validated order parameters
+            
+        Returns:
+            Order response
+        """
+        self._log_order_request(params)
         
-        print("=" * 70)
-        print()
+        response = await self.client.place_limit_order(
+            symbol=params['symbol'],
+            side=params['side'],
+            quantity=params['quantity'],
+            price=params['price']
+        )
+        
+        self._log_order_response(response)
+        
+        return response
@@ -1,3 +1,4 @@
+import re
 from typing import Optional
 from decimal import Decimal, InvalidOperation
 
@@ -7,6 +8,41 @@ class ValidationError(Exception):
     pass
 
 
+_SYMBOL_RE = re.compile(r'[A-Z0-9]{2,10}USDT')
+
+_SIDES = frozenset(('BUY', 'SELL'))
+_TYPES = frozenset(('MARKET', 'LIMIT'))
+
+# Allowed values and error message for each enumerated order field
+_VALIDATORS = {
+    'side': (_SIDES, "Side must be 'BUY' or 'SELL'"),
+    'type': (_TYPES, "Order type must be 'MARKET' or 'LIMIT'"),
+}
+
+
+def _check(kind: str, value: str) -> str:
+    """
+    Normalize an enumerated field and check it against its allowed values.
+    
+    Args:
+        kind: Key into _VALIDATORS
+        value: Raw input value
+        
+    Returns:
+        Uppercase value
+        
+    Raises:
+        ValidationError: If value is not allowed
+    """
+    value = value.strip().upper()
+    allowed, message = _VALIDATORS[kind]
+    
+    if value not in allowed:
+        raise ValidationError(message)
+    
+    return value
+
+
 def validate_symbol(symbol: str) -> str:
     """
     Validate trading symbol format.
@@ -23,13 +59,11 @@ def validate_symbol(symbol: str) -> str:
     if not symbol:
         raise ValidationError("Symbol cannot be empty")
     
-    symbol = symbol.upper().strip()
+    symbol = symbol.strip().upper()
     
-    if not symbol.endswith('USDT'):
-        raise ValidationError("Symbol must end with 'USDT' for USDT-M futures")
-    
-    if len(symbol) < 5:
-        raise ValidationError("Symbol is too short")
+    if not _SYMBOL_RE.fullmatch(symbol):
+        raise ValidationError("Symbol must be 2-10 letters or digits followed by "
+                              "'USDT' for USDT-M futures (e.g., BTCUSDT)")
     
     return symbol
 
@@ -47,12 +81,7 @@ def validate_side(side: str) -> str:
     Raises:
         ValidationError: If side is invalid
     """
-    side = side.upper().strip()
-    
-    if side not in ['BUY', 'SELL']:
-        raise ValidationError("Side must be 'BUY' or 'SELL'")
-    
-    return side
+    return _check('side', side)
 
 
 def validate_order_type(order_type: str) -> str:
@@ -68,15 +97,10 @@ def validate_order_type(order_type: str) -> str:
     Raises:
         ValidationError: If order type is invalid
     """
-    order_type = order_type.upper().strip()
-    
-    if order_type not in ['MARKET', 'LIMIT']:
-        raise ValidationError("Order type must be 'MARKET' or 'LIMIT'")
-    
-    return order_type
+    return _check('type', order_type)
 
 
-def validate_quantity(quantity: str) -> float:
+def validate_quantity(quantity: str) -> Decimal:
     """
     Validate order quantity.
     
@@ -84,14 +108,17 @@ def validate_quantity(quantity: str) -> float:
         quantity: Order quantity
         
     Returns:
-        Validated quantity as float
+        Validated quantity as Decimal
         
     Raises:
         ValidationError: If quantity is invalid
     """
     try:
-        qty = float(quantity)
-    except (ValueError, TypeError):
+        qty = Decimal(str(quantity).strip())
+    except (InvalidOperation, ValueError, TypeError):
+        raise ValidationError("Quantity must be a valid number")
+    
+    if not qty.is_finite():
         raise ValidationError("Quantity must be a valid number")
     
     if qty <= 0:
@@ -100,7 +127,7 @@ def validate_quantity(quantity: str) -> float:
     return qty
 
 
-def validate_price(price: Optional[str]) -> Optional[float]:
+def validate_price(price: Optional[str]) -> Optional[Decimal]:
     """
     Validate order price.
     
@@ -108,7 +135,7 @@ def validate_price(price: Optional[str]) -> Optional[float]:
         price: Order price (required for LIMIT orders)
         
     Returns:
-        Validated price as float or None
+        Validated price as Decimal or None
         
     Raises:
         ValidationError: If price is invalid
@@ -117,8 +144,11 @@ def validate_price(price: Optional[str]) -> Optional[float]:
         return None
     
     try:
-        p = float(price)
-    except (ValueError, TypeError):
+        p = Decimal(str(price).strip())
+    except (InvalidOperation, ValueError, TypeError):
+        raise ValidationError("Price must be a valid number")
+    
+    if not p.is_finite():
         raise ValidationError("Price must be a valid number")
     
     if p <= 0:
@@ -147,8 +177,8 @@ def validate_order_params(symbol: str, side: str, order_type: str,
     """
     validated = {
         'symbol': validate_symbol(symbol),
-        'side': validate_side(side),
-        'type': validate_order_type(order_type),
+        'side': _check('side', side),
+        'type': _check('type', order_type),
         'quantity': validate_quantity(quantity)
     }
     
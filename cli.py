@@ -1,16 +1,53 @@
 #!/usr/bin/env python3
+import asyncio
 import os
 import sys
 import click
-from colorama import init, Fore, Style
+import colorama
+from colorama import Fore
 
-from bot import BinanceTestnetClient, OrderManager, ValidationError, setup_logging
+from bot import (
+    AsyncBinanceTestnetClient, AsyncOrderManager, BinanceTestnetClient,
+    ValidationError, setup_logging
+)
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+# Emit ANSI colors directly, and only when writing to a terminal. On Windows
+# the console is switched to ANSI mode once instead of wrapping sys.stdout.
+if os.name == 'nt':
+    colorama.just_fix_windows_console()
+_USE_COLOR = sys.stdout.isatty()
 
-# Setup logging
-logger = setup_logging()
+
+def C(code, text):
+    """
+    Wrap text in an ANSI color code when color output is enabled.
+    
+    Args:
+        code: ANSI escape sequence (e.g., Fore.RED)
+        text: Text to color
+        
+    Returns:
+        Colored text, or the plain text when stdout is not a terminal
+    """
+    return f"{code}{text}\x1b[0m" if _USE_COLOR else text
+
+
+def init_logging(ctx):
+    """
+    Set up logging once per invocation, after arguments have been parsed.
+    
+    Deferring this keeps --help and usage errors from creating log files.
+    
+    Args:
+        ctx: Click context
+        
+    Returns:
+        Configured logger instance
+    """
+    obj = ctx.ensure_object(dict)
+    if 'logger' not in obj:
+        obj['logger'] = setup_logging(log_dir=obj.get('log_dir', 'logs'))
+    return obj['logger']
 
 
 def get_api_credentials():
@@ -27,11 +64,11 @@ def get_api_credentials():
     api_secret = os.environ.get('BINANCE_TESTNET_API_SECRET')
     
     if not api_key or not api_secret:
-        print(f"{Fore.RED}Error: API credentials not found in environment variables.")
-        print(f"{Fore.YELLOW}Please set the following environment variables:")
+        print(C(Fore.RED, "Error: API credentials not found in environment variables."))
+        print(C(Fore.YELLOW, "Please set the following environment variables:"))
         print("  - BINANCE_TESTNET_API_KEY")
         print("  - BINANCE_TESTNET_API_SECRET")
-        print(f"\nExample:{Style.RESET_ALL}")
+        print("\nExample:")
         print("  export BINANCE_TESTNET_API_KEY='your_api_key'")
         print("  export BINANCE_TESTNET_API_SECRET='your_api_secret'")
         sys.exit(1)
@@ -39,15 +76,38 @@ def get_api_credentials():
     return api_key, api_secret
 
 
+async def place_order_async(api_key, api_secret, **order_kwargs):
+    """
+    Place an order through the async client, print its summary and
+    close the client afterwards.
+    
+    Args:
+        api_key: Binance API key
+        api_secret: Binance API secret
+        **order_kwargs: Arguments forwarded to AsyncOrderManager.place_order
+        
+    Returns:
+        Order response dictionary
+    """
+    async with AsyncBinanceTestnetClient(api_key, api_secret) as client:
+        order_manager = AsyncOrderManager(client)
+        response = await order_manager.place_order(**order_kwargs)
+        order_manager.print_order_summary(response)
+        return response
+
+
 @click.group()
 @click.version_option(version='1.0.0')
-def cli():
+@click.option('--log-dir', default='logs', show_default=True,
+              help='Directory to store log files')
+@click.pass_context
+def cli(ctx, log_dir):
     """
     Binance Futures Testnet Trading Bot
     
     A command-line tool for placing orders on Binance Futures Testnet (USDT-M).
     """
-    pass
+    ctx.ensure_object(dict)['log_dir'] = log_dir
 
 
 @cli.command()
@@ -59,7 +119,10 @@ def cli():
               help='Order type: MARKET or LIMIT')
 @click.option('--quantity', '-q', required=True, help='Order quantity')
 @click.option('--price', '-p', default=None, help='Order price (required for LIMIT orders)')
-def order(symbol, side, order_type, quantity, price):
+@click.option('--precheck/--skip-precheck', default=False,
+              help='Ping the API before placing the order (default: skip)')
+@click.pass_context
+def order(ctx, symbol, side, order_type, quantity, price, precheck):
     """
     Place an order on Binance Futures Testnet.
     
@@ -70,28 +133,29 @@ def order(symbol, side, order_type, quantity, price):
     
       Place a limit sell order:
         python cli.py order -s ETHUSDT -d SELL -t LIMIT -q 0.01 -p 2500.50
+    
+      Ping the API before placing the order:
+        python cli.py order -s BTCUSDT -d BUY -t MARKET -q 0.001 --precheck
     """
+    logger = init_logging(ctx)
+    
     try:
         # Get API credentials
         api_key, api_secret = get_api_credentials()
         
-        # Initialize client
-        print(f"{Fore.CYAN}Initializing Binance Testnet client...{Style.RESET_ALL}")
-        client = BinanceTestnetClient(api_key, api_secret)
-        
-        # Test connection
-        if not client.test_connection():
-            print(f"{Fore.RED}Failed to connect to Binance Testnet API.")
-            print("Please check your API credentials and network connection.")
-            sys.exit(1)
-        
-        print(f"{Fore.GREEN}✓ Connected to Binance Futures Testnet{Style.RESET_ALL}\n")
-        
-        # Initialize order manager
-        order_manager = OrderManager(client)
+        # Optional reachability check; credentials are verified by the order itself
+        if precheck:
+            print(C(Fore.CYAN, "Checking Binance Testnet connectivity..."))
+            with BinanceTestnetClient(api_key, api_secret) as client:
+                if not client.ping():
+                    print(C(Fore.RED, "Failed to reach Binance Testnet API."))
+                    print("Please check your network connection.")
+                    sys.exit(1)
+            
+            print(C(Fore.GREEN, "✓ Connected to Binance Futures Testnet\n"))
         
         # Print order request summary
-        print(f"{Fore.CYAN}Order Request Summary:{Style.RESET_ALL}")
+        print(C(Fore.CYAN, "Order Request Summary:"))
         print(f"  Symbol:      {symbol.upper()}")
         print(f"  Side:        {side.upper()}")
         print(f"  Type:        {order_type.upper()}")
@@ -101,95 +165,100 @@ def order(symbol, side, order_type, quantity, price):
         print()
         
         # Confirm order
-        if not click.confirm(f"{Fore.YELLOW}Do you want to proceed with this order?{Style.RESET_ALL}"):
-            print(f"{Fore.YELLOW}Order cancelled.{Style.RESET_ALL}")
+        if not click.confirm(C(Fore.YELLOW, "Do you want to proceed with this order?")):
+            print(C(Fore.YELLOW, "Order cancelled."))
             return
         
-        print(f"\n{Fore.CYAN}Placing order...{Style.RESET_ALL}\n")
+        print(C(Fore.CYAN, "\nPlacing order...\n"))
         
         # Place order
-        response = order_manager.place_order(
+        asyncio.run(place_order_async(
+            api_key,
+            api_secret,
             symbol=symbol,
             side=side,
             order_type=order_type,
             quantity=quantity,
             price=price
-        )
+        ))
         
         # Print success message
-        order_manager.print_order_summary(response)
-        print(f"{Fore.GREEN}✓ Order placed successfully!{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Check the logs directory for detailed information.{Style.RESET_ALL}\n")
+        print(C(Fore.GREEN, "✓ Order placed successfully!"))
+        print(C(Fore.CYAN, "Check the logs directory for detailed information.\n"))
         
     except ValidationError as e:
-        print(f"\n{Fore.RED}Validation Error: {str(e)}{Style.RESET_ALL}")
+        print(C(Fore.RED, f"\nValidation Error: {str(e)}"))
         logger.error(f"Validation error: {str(e)}")
         sys.exit(1)
         
     except Exception as e:
-        print(f"\n{Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
+        print(C(Fore.RED, f"\nError: {str(e)}"))
         logger.error(f"Error placing order: {str(e)}", exc_info=True)
         sys.exit(1)
 
 
 @cli.command()
-def test():
+@click.pass_context
+def test(ctx):
     """
     Test API connection and credentials.
     """
+    logger = init_logging(ctx)
+    
     try:
         # Get API credentials
         api_key, api_secret = get_api_credentials()
         
         # Initialize client
-        print(f"{Fore.CYAN}Testing Binance Testnet connection...{Style.RESET_ALL}\n")
-        client = BinanceTestnetClient(api_key, api_secret)
-        
-        # Test connection
-        if client.test_connection():
-            print(f"{Fore.GREEN}✓ API connection successful!{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}✓ Your API credentials are valid.{Style.RESET_ALL}\n")
-            
-            # Try to get current price as additional test
-            print(f"{Fore.CYAN}Fetching current BTC price...{Style.RESET_ALL}")
-            price = client.get_current_price('BTCUSDT')
-            if price:
-                print(f"{Fore.GREEN}✓ Current BTC price: ${price:,.2f}{Style.RESET_ALL}\n")
-        else:
-            print(f"{Fore.RED}✗ API connection failed.{Style.RESET_ALL}")
-            print("Please check your API credentials and network connection.\n")
-            sys.exit(1)
+        print(C(Fore.CYAN, "Testing Binance Testnet connection...\n"))
+        with BinanceTestnetClient(api_key, api_secret) as client:
+            # Test connection
+            if client.test_connection():
+                print(C(Fore.GREEN, "✓ API connection successful!"))
+                print(C(Fore.GREEN, "✓ Your API credentials are valid.\n"))
+                
+                # Try to get current price as additional test
+                print(C(Fore.CYAN, "Fetching current BTC price..."))
+                price = client.get_current_price('BTCUSDT')
+                if price:
+                    print(C(Fore.GREEN, f"✓ Current BTC price: ${price:,.2f}\n"))
+            else:
+                print(C(Fore.RED, "✗ API connection failed."))
+                print("Please check your API credentials and network connection.\n")
+                sys.exit(1)
             
     except Exception as e:
-        print(f"\n{Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
+        print(C(Fore.RED, f"\nError: {str(e)}"))
         logger.error(f"Error testing connection: {str(e)}", exc_info=True)
         sys.exit(1)
 
 
 @cli.command()
 @click.option('--symbol', '-s', default='BTCUSDT', help='Trading pair symbol (default: BTCUSDT)')
-def price(symbol):
+@click.pass_context
+def price(ctx, symbol):
     """
     Get current market price for a symbol.
     """
+    logger = init_logging(ctx)
+    
     try:
         # Get API credentials
         api_key, api_secret = get_api_credentials()
         
         # Initialize client
-        client = BinanceTestnetClient(api_key, api_secret)
-        
-        # Get price
-        print(f"{Fore.CYAN}Fetching current price for {symbol.upper()}...{Style.RESET_ALL}\n")
-        current_price = client.get_current_price(symbol.upper())
+        with BinanceTestnetClient(api_key, api_secret) as client:
+            # Get price
+            print(C(Fore.CYAN, f"Fetching current price for {symbol.upper()}...\n"))
+            current_price = client.get_current_price(symbol.upper())
         
         if current_price:
-            print(f"{Fore.GREEN}Current {symbol.upper()} Price: ${current_price:,.2f}{Style.RESET_ALL}\n")
+            print(C(Fore.GREEN, f"Current {symbol.upper()} Price: ${current_price:,.2f}\n"))
         else:
-            print(f"{Fore.RED}Failed to fetch price for {symbol.upper()}{Style.RESET_ALL}\n")
+            print(C(Fore.RED, f"Failed to fetch price for {symbol.upper()}\n"))
             
     except Exception as e:
-        print(f"\n{Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
+        print(C(Fore.RED, f"\nError: {str(e)}"))
         logger.error(f"Error fetching price: {str(e)}", exc_info=True)
         sys.exit(1)
 
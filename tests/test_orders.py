@@ -0,0 +1,139 @@
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+
+import pytest
+
+from bot.client import _BinanceClientBase, _format_decimal
+from bot.orders import OrderManager, _Placer, _round_to_step
+from bot.validators import ValidationError
+
+
+SYMBOL_INFO = {
+    'symbol': 'BTCUSDT',
+    'status': 'TRADING',
+    'filters': [
+        {'filterType': 'PRICE_FILTER', 'tickSize': '0.10'},
+        {'filterType': 'LOT_SIZE', 'stepSize': '0.001'},
+    ],
+}
+
+
+class _RecordingClient(_BinanceClientBase):
+    """Stands in for BinanceTestnetClient and records submitted orders."""
+    
+    def __init__(self):
+        super().__init__('key', 'secret')
+        self.orders = []
+    
+    @property
+    def client(self):
+        return self
+    
+    def futures_create_order(self, **params):
+        self.orders.append(params)
+        return {'orderId': len(self.orders)}
+
+
+def _placer(order_type):
+    return _Placer(_RecordingClient(), 'BTCUSDT', 'BUY', order_type,
+                   Decimal('0.001'), Decimal('0.10'))
+
+
+def test_round_to_step_quantizes_to_step_exponent():
+    assert str(_round_to_step(Decimal('0.1239'), Decimal('0.001'), ROUND_DOWN)) == '0.123'
+    assert str(_round_to_step(Decimal('2500.56'), Decimal('0.10'), ROUND_HALF_UP)) == '2500.60'
+
+
+def test_round_to_step_expands_exponent_notation():
+    rounded = _round_to_step(Decimal('1E+2'), Decimal('0.001'), ROUND_DOWN)
+    assert _format_decimal(rounded) == '100.000'
+
+
+def test_round_to_step_without_step_is_unchanged():
+    assert _round_to_step(Decimal('0.0000001'), None, ROUND_DOWN) == Decimal('0.0000001')
+
+
+@pytest.mark.parametrize('value, expected', [
+    (Decimal('1E+2'), '100'),
+    (Decimal('1E-7'), '0.0000001'),
+    (Decimal('0.12300000'), '0.12300000'),
+    (0.001, '0.001'),
+    ('2500.5', '2500.5'),
+])
+def test_format_decimal_never_uses_exponent(value, expected):
+    assert _format_decimal(value) == expected
+
+
+def test_order_params_are_serialized_positionally():
+    market = _BinanceClientBase._market_order_params('BTCUSDT', 'BUY', Decimal('1E-7'))
+    limit = _BinanceClientBase._limit_order_params(
+        'BTCUSDT', 'SELL', Decimal('1E+2'), Decimal('2.5E+3'), 'GTC'
+    )
+    
+    assert market['quantity'] == '0.0000001'
+    assert limit['quantity'] == '100'
+    assert limit['price'] == '2500'
+
+
+def test_apply_filters_rounds_quantity_and_price():
+    params = {'symbol': 'BTCUSDT', 'type': 'LIMIT',
+              'quantity': Decimal('1E+2'), 'price': Decimal('2500.56')}
+    
+    OrderManager(client=None)._apply_filters(params, SYMBOL_INFO)
+    
+    assert _format_decimal(params['quantity']) == '100.000'
+    assert _format_decimal(params['price']) == '2500.60'
+
+
+def test_apply_filters_rejects_quantity_below_step():
+    params = {'symbol': 'BTCUSDT', 'type': 'MARKET', 'quantity': Decimal('0.0004')}
+    
+    with pytest.raises(ValidationError):
+        OrderManager(client=None)._apply_filters(params, SYMBOL_INFO)
+
+
+@pytest.mark.parametrize('field', ['quantity', 'price'])
+def test_apply_filters_rejects_out_of_range_values(field):
+    params = {'symbol': 'BTCUSDT', 'type': 'LIMIT',
+              'quantity': Decimal('0.01'), 'price': Decimal('2500')}
+    params[field] = Decimal('1e30')
+    
+    with pytest.raises(ValidationError, match='out of range'):
+        OrderManager(client=None)._apply_filters(params, SYMBOL_INFO)
+
+
+@pytest.mark.parametrize('quantity', ['0.0004', 'abc', '-1', '1e26', '1e30'])
+def test_placer_rejects_invalid_quantity(quantity):
+    placer = _placer('MARKET')
+    
+    with pytest.raises(ValidationError):
+        placer.submit(quantity)
+    assert placer._client.orders == []
+
+
+def test_placer_rejects_price_for_market_orders():
+    with pytest.raises(ValidationError):
+        _placer('MARKET').submit('0.01', price='2500')
+
+
+def test_placer_rejects_out_of_range_price():
+    placer = _placer('LIMIT')
+    
+    with pytest.raises(ValidationError, match='out of range'):
+        placer.submit('0.01', price='1e30')
+    assert placer._client.orders == []
+
+
+def test_placer_requires_price_for_limit_orders():
+    with pytest.raises(ValidationError):
+        _placer('LIMIT').submit('0.01')
+
+
+def test_placer_submits_rounded_positional_values():
+    placer = _placer('LIMIT')
+    
+    placer.submit('1E+2', price='2500.56')
+    
+    order = placer._client.orders[0]
+    assert order['quantity'] == '100.000'
+    assert order['price'] == '2500.60'
+    assert 'timestamp' in order